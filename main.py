@@ -24,7 +24,14 @@ import logging
 import csv
 import io
 import asyncio
-from telegram import Update, Poll
+import random
+from collections import OrderedDict
+import re
+import httpx
+from operator import itemgetter
+from typing import BinaryIO, List, NamedTuple, Optional, Tuple
+from telegram import Chat, Update, Poll
+from telegram.error import BadRequest, RetryAfter, TimedOut, NetworkError
 from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, filters
 
 # ---------------- CONFIGURATION ---------------- #
@@ -38,6 +45,161 @@ logging.basicConfig(
     level=logging.INFO
 )
 
+# send_poll fail hone par kitni baar try karna hai
+MAX_SEND_ATTEMPTS = 5
+# Ek saath kitne send_poll requests chal sakte hain
+MAX_CONCURRENT_POLLS = 8
+# Dialect sniffing ke liye kitna sample aur kitna time
+SNIFF_SAMPLE_SIZE = 4096
+SNIFF_TIMEOUT = 0.5
+# Sniffer ka regex quotes ke saath quadratic hai - sample me itne se zyada quotes nahi jaane dete
+SNIFF_MAX_QUOTES = 512
+# Report messages ka max size (Telegram limit 4096 chars hai)
+REPORT_CHUNK_SIZE = 3500
+# Har user ke kitne CSV header formats yaad rakhne hain
+CSV_CACHE_SIZE = 8
+
+# Telegram sendPoll explanation max 200 chars leta hai
+MAX_EXPLANATION_LEN = 200
+
+REQUIRED_HEADERS = ['Question', 'Option A', 'Option B', 'Option C', 'Option D', 'Answer', 'Description']
+
+# Telegram ki rate limits: private chat me ~1 msg/sec, group me 20 msg/min, poore bot ke liye ~30 msg/sec
+GLOBAL_RATE = 30
+CHAT_RATE = 1
+GROUP_RATE = 20 / 60
+# Kitne chats ke rate buckets yaad rakhne hain (isse zyada hon to purane idle wale hata diye jaate hain)
+MAX_CHAT_BUCKETS = 1024
+
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter - jab tak token hai turant bhejo, warna wait karo"""
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._last = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._last is not None and now < self._last:
+                    # Bucket paused hai (flood wait chal raha hai)
+                    await asyncio.sleep(self._last - now)
+                    continue
+                if self._last is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.refill_rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+
+    def is_idle(self):
+        """Koi wait nahi kar raha aur bucket poora bhar chuka hai - hata diya to naya bucket bhi bilkul same behave karega"""
+        if self._lock.locked():
+            return False
+        if self._last is None:
+            return True
+        now = asyncio.get_running_loop().time()
+        if now < self._last:
+            return False  # Paused (flood wait)
+        return self._tokens + (now - self._last) * self.refill_rate >= self.capacity
+
+    def pause(self, seconds):
+        """Bucket ko `seconds` tak band kar deta hai - is bucket ke saare senders rukenge"""
+        now = asyncio.get_running_loop().time()
+        self._tokens = 0
+        self._last = max(self._last or now, now + seconds)
+
+
+def get_rate_buckets(context: ContextTypes.DEFAULT_TYPE, chat: Chat):
+    """Global bucket aur is chat ka bucket return karta hai (bot_data me store hote hain)"""
+    chat_id = chat.id
+    buckets = context.bot_data.get("rate_buckets")
+    if buckets is None:
+        buckets = context.bot_data["rate_buckets"] = {
+            "global": AsyncTokenBucket(GLOBAL_RATE, GLOBAL_RATE),
+            "chats": OrderedDict(),
+        }
+    chats = buckets["chats"]
+    chat_bucket = chats.get(chat_id)
+    if chat_bucket is not None:
+        chats.move_to_end(chat_id)
+        return buckets["global"], chat_bucket
+
+    chat_rate = CHAT_RATE if chat.type == Chat.PRIVATE else GROUP_RATE
+    chat_bucket = chats[chat_id] = AsyncTokenBucket(1, chat_rate)
+    # Purane idle buckets hatao (sabse purane pehle); busy ya paused wale chhod do
+    if len(chats) > MAX_CHAT_BUCKETS:
+        for old_id in list(chats):
+            if len(chats) <= MAX_CHAT_BUCKETS:
+                break
+            if old_id != chat_id and chats[old_id].is_idle():
+                del chats[old_id]
+    return buckets["global"], chat_bucket
+
+def _retry_after_seconds(e: RetryAfter) -> float:
+    """RetryAfter ka wait time seconds me (PTB version ke hisaab se int ya timedelta hota hai)"""
+    retry_after = e.retry_after
+    if hasattr(retry_after, "total_seconds"):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+async def _send_with_retry(send, global_bucket, chat_bucket):
+    """Rate limit token lekar `send()` call karta hai; 429 aur connection errors par retry karta hai"""
+    need_chat_token = True
+    for attempt in range(MAX_SEND_ATTEMPTS):
+        # Rate limit ke andar rehne ke liye token lo (low volume pe turant milta hai).
+        # Pehle chat token, phir global - taaki global token sirf asli send ke time use ho.
+        if need_chat_token:
+            await chat_bucket.acquire()
+        await global_bucket.acquire()
+        need_chat_token = True
+        try:
+            return await send()
+        except RetryAfter as e:
+            # Telegram ne flood wait bola hai - utna hi ruko, phir same message dobara
+            if attempt == MAX_SEND_ATTEMPTS - 1:
+                raise
+            wait = _retry_after_seconds(e) + 0.1
+            logging.warning(f"Flood control, {wait:.1f}s wait kar rahe hain")
+            # Is chat ke baaki concurrent senders bhi rukein; pause ke baad ye message sabse pehle jaaye
+            chat_bucket.pause(wait)
+            await asyncio.sleep(wait)
+            need_chat_token = False
+        except BadRequest:
+            # Telegram ye request kabhi accept nahi karega
+            raise
+        except TimedOut as e:
+            # Pool timeout me request Telegram tak gayi hi nahi - retry safe hai.
+            # Read/write timeout me shayad pahunch gayi ho - retry se same message do baar post ho sakta hai.
+            if not isinstance(e.__cause__, httpx.PoolTimeout) or attempt == MAX_SEND_ATTEMPTS - 1:
+                raise
+            wait = 2 ** attempt + random.uniform(0, 1)
+            logging.warning(f"Connection pool bhara hua hai, {wait:.1f}s baad retry")
+            await asyncio.sleep(wait)
+        except NetworkError as e:
+            if attempt == MAX_SEND_ATTEMPTS - 1:
+                raise
+            wait = 2 ** attempt + random.uniform(0, 1)
+            logging.warning(f"Network error ({e}), {wait:.1f}s baad retry")
+            await asyncio.sleep(wait)
+
+async def send_poll_with_retry(context: ContextTypes.DEFAULT_TYPE, global_bucket, chat_bucket, **poll_kwargs):
+    """Rate limit ke andar poll bhejta hai (retry ke saath)"""
+    return await _send_with_retry(lambda: context.bot.send_poll(**poll_kwargs), global_bucket, chat_bucket)
+
+async def reply_with_retry(update: Update, context: ContextTypes.DEFAULT_TYPE, text: str, **kwargs):
+    """Rate limit ke andar reply bhejta hai - polls ke saath same chat bucket share karta hai"""
+    global_bucket, chat_bucket = get_rate_buckets(context, update.effective_chat)
+    return await _send_with_retry(lambda: update.message.reply_text(text, **kwargs), global_bucket, chat_bucket)
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Bot start hone par ye message dikhayega"""
     await update.message.reply_text(
@@ -46,72 +208,276 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "`Question,Option A,Option B,Option C,Option D,Answer,Description`\n\n"
         "Rules:\n"
         "1. Answer must be A, B, C, or D\n"
-        "2. Description < 240 chars",
+        f"2. Description <= {MAX_EXPLANATION_LEN} chars",
         parse_mode="Markdown"
     )
 
-async def process_csv_content(update: Update, context: ContextTypes.DEFAULT_TYPE, csv_file_content: str):
-    """CSV content ko parse karke Polls bhejne ka logic"""
-    
-    # CSV file ko read karna
-    f = io.StringIO(csv_file_content)
-    reader = csv.DictReader(f)
-    
-    # Headers check karna
-    required_headers = ['Question', 'Option A', 'Option B', 'Option C', 'Option D', 'Answer', 'Description']
-    if reader.fieldnames != required_headers:
-        await update.message.reply_text(
-            f"❌ Error: CSV Headers match nahi ho rahe.\nExpected: {required_headers}\nGot: {reader.fieldnames}"
+class PollSpec(NamedTuple):
+    """CSV ki ek valid row - ek quiz poll"""
+    row_number: int
+    question: str
+    options: List[str]
+    correct_option_id: int
+    explanation: str
+
+_NORM_RE = re.compile(r"[^0-9A-Za-z]")
+
+def _normalize_header(h: str) -> str:
+    """Header ko compare karne layak banata hai: 'Option A' -> 'optiona'"""
+    return _NORM_RE.sub("", h).lower()
+
+REQUIRED_NORMALS = {_normalize_header(h) for h in REQUIRED_HEADERS}
+# Normalized key -> original header naam (error message ke liye)
+_NORMAL_TO_HUMAN = {_normalize_header(h): h for h in REQUIRED_HEADERS}
+
+# Normalized header keys - ek hi baar compute hote hain
+_NK_Q = _normalize_header("Question")
+_NK_A = _normalize_header("Option A")
+_NK_B = _normalize_header("Option B")
+_NK_C = _normalize_header("Option C")
+_NK_D = _normalize_header("Option D")
+_NK_ANS = _normalize_header("Answer")
+_NK_EXPL = _normalize_header("Description")
+
+# Pasted text CSV hai ya nahi - sirf pehli line par, jo "Question" + delimiter se shuru ho
+_HEADER_RE = re.compile(r"\W*question\W*[,;\t].*option\s*a", re.I)
+
+# Answer letter -> correct_option_id
+_MAPPER = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+async def _detect_dialect(sample: str):
+    """CSV ke shuru wale sample se dialect (comma/semicolon/tab) detect karta hai; timeout ya error par csv.excel"""
+    # Fast path: standard comma/tab header ho to Sniffer chalane ki zaroorat nahi
+    first_line = sample.split("\n", 1)[0]
+    if first_line.isascii():
+        for delimiter, dialect in ((",", csv.excel), ("\t", csv.excel_tab)):
+            tokens = {_normalize_header(t) for t in first_line.split(delimiter)}
+            if REQUIRED_NORMALS.issubset(tokens):
+                return dialect
+
+    # Sirf poori lines lo jab tak quotes limit ke andar hain. Regex GIL pakad ke rakhta hai,
+    # isliye thread/timeout event loop ko nahi bacha sakte - asli guard yahi limit hai.
+    bounded = []
+    quotes = 0
+    for line in sample.splitlines(keepends=True):
+        quotes += line.count('"')
+        if quotes > SNIFF_MAX_QUOTES:
+            break
+        bounded.append(line)
+    if not bounded:
+        return csv.excel
+
+    sniffer = csv.Sniffer()
+    try:
+        # Timeout sirf backup hai
+        return await asyncio.wait_for(asyncio.to_thread(sniffer.sniff, "".join(bounded), delimiters=",;\t"), SNIFF_TIMEOUT)
+    except asyncio.TimeoutError:
+        logging.warning("CSV sniffing timeout, default comma dialect use kar rahe hain")
+    except csv.Error:
+        pass
+    return csv.excel
+
+def _resolve_columns(headers: List[str]) -> Tuple[Tuple[int, ...], List[str]]:
+    """Header row se required columns ke indices nikalta hai. (indices, warnings) return karta hai"""
+
+    # Headers check karna (case/space/order se farak nahi padta)
+    header_norms = [_normalize_header(h) for h in headers]
+    header_map = {}
+    for i, norm in enumerate(header_norms):
+        header_map.setdefault(norm, i)  # Duplicate column ho to pehla wala use hoga
+    missing = REQUIRED_NORMALS.difference(header_map)
+    if missing:
+        # REQUIRED_HEADERS ke order me, taaki message har baar same dikhe
+        human_missing = [human for norm, human in _NORMAL_TO_HUMAN.items() if norm in missing]
+        raise ValueError(
+            f"❌ Error: CSV Headers match nahi ho rahe.\nMissing: {human_missing}\nExpected: {REQUIRED_HEADERS}\nGot: {headers}"
         )
-        return
 
-    count = 0
-    await update.message.reply_text("⏳ Processing quiz... Please wait.")
+    indices = (
+        header_map[_NK_Q],
+        header_map[_NK_A],
+        header_map[_NK_B],
+        header_map[_NK_C],
+        header_map[_NK_D],
+        header_map[_NK_ANS],
+        header_map[_NK_EXPL],
+    )
 
-    for row in reader:
-        question = row['Question'].strip()
-        options = [
-            row['Option A'].strip(),
-            row['Option B'].strip(),
-            row['Option C'].strip(),
-            row['Option D'].strip()
+    warnings = []
+    if len(header_norms) != len(header_map):
+        duplicates = [
+            headers[i] for i, norm in enumerate(header_norms)
+            if norm in REQUIRED_NORMALS and header_map[norm] != i
         ]
-        answer_key = row['Answer'].strip().upper()
-        explanation = row['Description'].strip()
+        if duplicates:
+            warnings.append(f"header: duplicate columns {duplicates} ignore kiye, pehla column use hua")
+    return indices, warnings
+
+def _parse_rows(
+    csv_stream: BinaryIO,
+    dialect=csv.excel,
+    encoding: str = "utf-8-sig",
+    columns: Optional[Tuple[Tuple[int, ...], List[str]]] = None,
+) -> Tuple[List[PollSpec], List[str], Tuple[Tuple[int, ...], List[str]]]:
+    """CSV bytes stream ko parse + validate karta hai. (polls, warnings, columns) return karta hai
+
+    `columns` = _resolve_columns ka result (indices, header warnings). Pehle se pata ho (cache se)
+    to header validation skip hota hai, lekin header warnings phir bhi report me aate hain.
+    """
+
+    # CSV file ko read karna - bytes chunk-by-chunk decode hote hain, poora text memory me nahi banta
+    f = io.TextIOWrapper(csv_stream, encoding=encoding, errors="replace", newline="")
+    reader = csv.reader(f, dialect=dialect)
+    headers = next(reader, None) or []
+
+    if columns is None:
+        columns = _resolve_columns(headers)
+    indices, header_warnings = columns
+    warnings = list(header_warnings)
+
+    get_fields = itemgetter(*indices)
+    required_cols = max(indices) + 1
+
+    # (row_number, message) - dono passes ke warnings ko end me row order me sort karte hain
+    row_warnings = []
+    rows_raw = []
+    for row_number, row in enumerate(reader, start=2):
+        if not row:
+            continue  # Khali line
+        if len(row) < required_cols:
+            row_warnings.append((row_number, f"row {row_number}: columns kam hain"))
+            continue
+        rows_raw.append((row_number, get_fields(row)))
 
+    # Saare fields ek hi pass me strip; Description Telegram ki limit (200 chars) se lambi ho to truncate
+    parsed = [
+        (
+            row_number,
+            q.strip(),
+            [a.strip(), b.strip(), c.strip(), d.strip()],
+            ans.strip().upper(),
+            (e[:MAX_EXPLANATION_LEN - 1] + "…") if len(e := raw_e.strip()) > MAX_EXPLANATION_LEN else e,
+        )
+        for row_number, (q, a, b, c, d, ans, raw_e) in rows_raw
+    ]
+
+    polls = []
+    for row_number, question, options, answer_key, explanation in parsed:
         # --- VALIDATION ---
-        # 1. Answer A/B/C/D check
-        mapper = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
-        if answer_key not in mapper:
-            await update.message.reply_text(f"⚠️ Skipping Question: '{question[:20]}...' (Answer {answer_key} valid nahi hai)")
+        # 1. Question aur saare options bhare hone chahiye
+        if not question or "" in options:
+            row_warnings.append((row_number, f"row {row_number}: question ya koi option khali hai"))
             continue
-        
-        correct_option_id = mapper[answer_key]
 
-        # 2. Description length check
-        if len(explanation) > 240:
-            explanation = explanation[:237] + "..." # Truncate kar diya taaki error na aaye
+        # 2. Answer A/B/C/D check
+        correct_option_id = _MAPPER.get(answer_key, -1)
+        if correct_option_id < 0:
+            row_warnings.append((row_number, f"row {row_number}: '{question[:20]}...' (Answer {answer_key} valid nahi hai)"))
+            continue
 
-        # --- SEND POLL ---
-        try:
-            await context.bot.send_poll(
-                chat_id=update.effective_chat.id,
-                question=question,
-                options=options,
-                type=Poll.QUIZ,
-                correct_option_id=correct_option_id,
-                explanation=explanation,
-                is_anonymous=False # Name dikhega kisne answer diya (Optional)
-            )
-            count += 1
-            # Rate limit avoid karne ke liye thoda wait
-            await asyncio.sleep(1) 
-
-        except Exception as e:
-            logging.error(f"Error sending poll: {e}")
-            await update.message.reply_text(f"❌ Error in question: {question}\nError: {str(e)}")
-
-    await update.message.reply_text(f"✅ Done! Total {count} quizzes generated.")
+        polls.append(PollSpec(row_number, question, options, correct_option_id, explanation))
+
+    row_warnings.sort()
+    warnings.extend(msg for _, msg in row_warnings)
+    return polls, warnings, columns
+
+async def _dispatch_polls(context: ContextTypes.DEFAULT_TYPE, chat: Chat, polls: List[PollSpec]) -> Tuple[int, List[str]]:
+    """Saare polls concurrently bhejta hai (semaphore + rate limit ke andar). (sent count, errors) return karta hai"""
+    global_bucket, chat_bucket = get_rate_buckets(context, chat)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+
+    async def _send_one(poll: PollSpec):
+        async with semaphore:
+            try:
+                await send_poll_with_retry(
+                    context,
+                    global_bucket,
+                    chat_bucket,
+                    chat_id=chat.id,
+                    question=poll.question,
+                    options=poll.options,
+                    type=Poll.QUIZ,
+                    correct_option_id=poll.correct_option_id,
+                    explanation=poll.explanation,
+                    is_anonymous=False, # Name dikhega kisne answer diya (Optional)
+                    # Read/write timeout retry nahi hota (poll shayad post ho chuka ho), isliye PTB ke
+                    # default 5s se zyada time dete hain - slow response par bhi poll fail report na ho
+                    read_timeout=10,
+                    write_timeout=10,
+                )
+                return poll.row_number, True, None
+            except Exception as e:
+                logging.error(f"Error sending poll (row {poll.row_number}): {e}")
+                return poll.row_number, False, str(e)
+
+    results = await asyncio.gather(*[_send_one(p) for p in polls])
+
+    count = sum(1 for _, ok, _ in results if ok)
+    errors = [f"row {row_number}: {err}" for row_number, ok, err in results if not ok]
+    return count, errors
+
+def _chunk_lines(lines: List[str], size: int = REPORT_CHUNK_SIZE) -> List[str]:
+    """Lines ko jod kar `size` chars tak ke blocks banata hai"""
+    chunks = []
+    current = ""
+    for line in lines:
+        line = line[:size]
+        if current and len(current) + 1 + len(line) > size:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def process_csv_content(update: Update, context: ContextTypes.DEFAULT_TYPE, csv_stream: BinaryIO):
+    """CSV content (bytes stream) ko parse karke Polls bhejne ka logic"""
+    head = csv_stream.read(SNIFF_SAMPLE_SIZE)
+    csv_stream.seek(0)
+
+    # Spreadsheet wali CSV utf-8 (BOM ke saath ya bina) ya utf-16 hoti hai; kharab bytes crash na karein
+    encoding = "utf-16" if head[:2] in (b"\xff\xfe", b"\xfe\xff") else "utf-8-sig"
+    sample = head.decode(encoding, errors="ignore")
+
+    # Same header line wali CSV pehle aa chuki hai to dialect aur columns (indices + header warnings) cache se
+    csv_cache = context.user_data.setdefault("csv_cache", OrderedDict())
+    header_line = sample.split("\n", 1)[0].rstrip("\r")
+    cached = csv_cache.get(header_line)
+    if cached is not None:
+        csv_cache.move_to_end(header_line)
+        dialect, columns = cached
+    else:
+        dialect = await _detect_dialect(sample)
+        columns = None
+
+    try:
+        # Parsing CPU ka kaam hai - thread me chalate hain taaki baaki users ke handlers na rukein
+        polls, warnings, columns = await asyncio.to_thread(_parse_rows, csv_stream, dialect, encoding, columns)
+    except ValueError as e:
+        await reply_with_retry(update, context, str(e))
+        return
+
+    if cached is None:
+        csv_cache[header_line] = (dialect, columns)
+        if len(csv_cache) > CSV_CACHE_SIZE:
+            csv_cache.popitem(last=False)
+
+    await reply_with_retry(update, context, "⏳ Processing quiz... Please wait.")
+
+    count, errors = await _dispatch_polls(context, update.effective_chat, polls)
+
+    # Skipped rows aur fail hue polls ka ek consolidated report (har row ka alag message nahi)
+    report = []
+    if warnings:
+        report.append("⚠️ Ye rows skip hui:")
+        report.extend(warnings)
+    if errors:
+        report.append("❌ Ye questions send nahi hue:")
+        report.extend(errors)
+    for chunk in _chunk_lines(report):
+        await reply_with_retry(update, context, chunk)
+
+    await reply_with_retry(update, context, f"✅ Done! Total {count} quizzes generated.")
 
 async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Jab user .csv file bhejta hai"""
@@ -124,18 +490,19 @@ async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     file = await context.bot.get_file(document.file_id)
     
-    # File download karke memory me read karein
-    file_byte_array = await file.download_as_bytearray()
-    content = file_byte_array.decode('utf-8')
-    
-    await process_csv_content(update, context, content)
+    # File seedha memory stream me download karein (extra copy nahi)
+    csv_stream = io.BytesIO()
+    await file.download_to_memory(out=csv_stream)
+    csv_stream.seek(0)
+
+    await process_csv_content(update, context, csv_stream)
 
 async def handle_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Jab user direct CSV code paste karta hai"""
     text = update.message.text
-    # Simple check agar text me CSV headers hain
-    if "Question,Option A" in text:
-        await process_csv_content(update, context, text)
+    # Sirf shuru ke text me CSV headers check karte hain (poora message scan nahi)
+    if _HEADER_RE.match(text[:512].split("\n", 1)[0]):
+        await process_csv_content(update, context, io.BytesIO(text.encode("utf-8")))
     else:
         await update.message.reply_text("⚠️ Ye valid CSV format nahi lag raha. Start command use karein help ke liye.")
 
@@ -148,7 +515,13 @@ if __name__ == '__main__':
     application.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), handle_text))
     
     print("🤖 Bot is Running...")
-    application.run_polling()
+    # Sirf messages chahiye; purane pending updates chhod do, aur lamba long-poll rakho
+    application.run_polling(
+        allowed_updates=[Update.MESSAGE],
+        drop_pending_updates=True,
+        poll_interval=0.0,
+        timeout=30,
+    )
     
 if __name__ == '__main__':
     keep_alive()  # <--- YE LINE ZAROORI HAI